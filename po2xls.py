@@ -1,11 +1,8 @@
-import os
 import click
-import polib
-import openpyxl
 
 
 from pathlib import Path
-from po_excel_translate import ColumnHeaders, PortableObjectFile, PortableObjectFileToXLSX, CommentType
+from po_excel_translate import PortableObjectFileToXLSX, CommentType, load_po_files
 
 
 # Widths are in range [0, 200]
@@ -25,9 +22,31 @@ from po_excel_translate import ColumnHeaders, PortableObjectFile, PortableObject
 @click.option(
     "--width-message-id", type=click.IntRange(0, 200), default=80, help="Width of the message id", show_default=True
 )
+@click.option(
+    "--fast-xml",
+    is_flag=True,
+    default=False,
+    help="Write the rows directly as XML, faster for very large catalogs. Messages starting with = stay text",
+    show_default=True,
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Directory to cache the parsed PO files in, makes running again on unchanged files faster. "
+    "The cache files are loaded with pickle, only use a directory that no one else can write to",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(0),
+    default=1,
+    help="Number of processes used to parse the PO files in parallel, 0 means the number of CPUs",
+    show_default=True,
+)
 @click.option("-o", "--output", type=str, default="messages.xlsx", help="Output file", show_default=True)
 @click.argument("catalogs_paths", metavar="CATALOG", nargs=-1, required=True, type=click.Path())
-def main(comments, width_message_context, width_message_id, output, catalogs_paths):
+def main(comments, width_message_context, width_message_id, fast_xml, cache_dir, jobs, output, catalogs_paths):
     """
     Convert .PO files to an XLSX file.
 
@@ -36,9 +55,7 @@ def main(comments, width_message_context, width_message_id, output, catalogs_pat
     can also specify the locale manually by adding prefixing the filename
     with "<locale>:". For example: "nl:locales/nl/mydomain.po".
     """
-    po_files = []
-    for path in catalogs_paths:
-        po_files.append(PortableObjectFile(path))
+    po_files = load_po_files(catalogs_paths, jobs=jobs, cache_dir=cache_dir)
 
     comment_types = []
     for s in comments:
@@ -51,6 +68,7 @@ def main(comments, width_message_context, width_message_id, output, catalogs_pat
         output_file_path=output_file_path,
         width_message_context=width_message_context,
         width_message_id=width_message_id,
+        fast_xml=fast_xml,
     )
 
     print(f"Generated {output_file_path.absolute()}")
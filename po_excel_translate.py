@@ -1,6 +1,13 @@
 import os
 import sys
 import time
+import zipfile
+import itertools
+import pickle
+import hashlib
+import tempfile
+import operator
+import functools
 import click
 import polib
 import openpyxl
@@ -9,14 +16,76 @@ from typing import List
 from pathlib import Path
 from enum import Enum, unique
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
 from openpyxl.styles import Font, Alignment, Protection
 from openpyxl.utils import get_column_letter
 from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.utils.exceptions import IllegalCharacterError
 
 
 
 
+@functools.lru_cache(maxsize=32)
+def format_po_timestamp(mtime: float) -> str:
+    """ Formats a modification time for the PO-Revision-Date metadata """
+    local = time.localtime(mtime)
+    offset = -(time.altzone if local.tm_isdst else time.timezone)
+    sign = "-" if offset < 0 else "+"
+    return f"{time.strftime('%Y-%m-%d %H:%M', local)}{sign}{time.strftime('%H%M', time.gmtime(abs(offset)))}"
+
+
+def load_po_file(file_path: str, encoding: str, cache_dir: str = None) -> polib.POFile:
+    """
+    Parses a po file, there is no cache between calls in the same process (load_po_files only skips repeated paths).
+    If cache_dir is set the parsed file is also pickled there, to be reused between runs until it is modified.
+    NOTE: unpickling can run arbitrary code, cache_dir must only be writable by the user running this.
+    """
+    if not cache_dir:
+        return polib.pofile(file_path, encoding=encoding)
+
+    # One cache file per po file, the name changes when the po file is modified
+    cache_dir = Path(cache_dir)
+    cache_key = f"{file_path}|{encoding}|{polib.__version__}"
+    cache_name = hashlib.blake2b(cache_key.encode("utf-8"), digest_size=16).hexdigest()
+    mtime = os.stat(file_path).st_mtime_ns
+    cache_file_path = cache_dir / f"{cache_name}-{mtime}.pickle"
+
+    try:
+        with open(cache_file_path, "rb") as cache_file:
+            return pickle.load(cache_file)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"[WARNING] Ignoring the invalid cache file {cache_file_path}: {e}")
+
+    po_file = polib.pofile(file_path, encoding=encoding)
+
+    # The cache is optional, failing to write it must not fail the parse
+    temp_file_path = None
+    try:
+        # Remove the cache files of the older versions of the po file, another run might be removing them too
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for old_cache_file_path in cache_dir.glob(f"{cache_name}-*.pickle"):
+            try:
+                old_cache_file_path.unlink()
+            except FileNotFoundError:
+                pass
+
+        # Unique temporary file, so runs at the same time do not write to the same one
+        temp_file, temp_file_path = tempfile.mkstemp(prefix=f"{cache_name}-", suffix=".tmp", dir=str(cache_dir))
+        with open(temp_file, "wb") as cache_file:
+            pickle.dump(po_file, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file_path, cache_file_path)
+    except (OSError, pickle.PicklingError) as e:
+        print(f"[WARNING] Could not write the cache file {cache_file_path}: {e}")
+        if temp_file_path and os.path.exists(temp_file_path):
+            os.remove(temp_file_path)
+
+    return po_file
+
+
 class ColumnHeaders:
     message_context = "Message context"
     message_id = "Message id"
@@ -45,7 +114,7 @@ class CommentType(Enum):
 class PortableObjectFile:
     """ Represents a po file """
 
-    def __init__(self, file_path, locale=None, encoding="utf-8"):
+    def __init__(self, file_path, locale=None, encoding="utf-8", cache_dir=None):
         self.file_path = str(file_path)
         self.po_file = None
         self.locale = locale
@@ -55,10 +124,10 @@ class PortableObjectFile:
             # The user passed a <locale>:<path> value
             self.locale, self.file_path = self.file_path.split(":", 1)
             self.file_path = Path(self.file_path).resolve()
-            self.po_file = polib.pofile(self.file_path, encoding=encoding)
+            self.po_file = load_po_file(str(self.file_path), encoding, cache_dir)
         else:
             self.file_path = Path(self.file_path).resolve()
-            self.po_file = polib.pofile(self.file_path, encoding=encoding)
+            self.po_file = load_po_file(str(self.file_path), encoding, cache_dir)
 
             # Fallback to metadata
             if not self.locale:
@@ -68,8 +137,37 @@ class PortableObjectFile:
             if not self.locale:
                 self.locale = self.file_path.stem
 
+        # Lookup table for the messages, polib find() is a linear search
+        self.index = {}
+        self.has_message_context = False
+        for m in self.po_file:
+            if not m.msgid or m.obsolete:
+                continue
+
+            self.index[(m.msgid, m.msgctxt)] = m
+            if m.msgctxt:
+                self.has_message_context = True
+
     def has_any_message_context(self):
-        return any(m.msgctxt for m in self.po_file)
+        return self.has_message_context
+
+
+def load_po_files(file_paths, jobs: int = 1, **kwargs) -> List[PortableObjectFile]:
+    """
+    Loads multiple po files, in parallel processes if jobs (0 means the number of CPUs) is more than 1.
+    The kwargs are passed to PortableObjectFile, a path given more than once is only loaded once.
+    """
+    file_paths = list(file_paths)
+    unique_file_paths = list(dict.fromkeys(file_paths))
+    jobs = min(len(unique_file_paths), jobs or os.cpu_count() or 1)
+    if jobs <= 1:
+        po_files = [PortableObjectFile(path, **kwargs) for path in unique_file_paths]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            po_files = list(executor.map(functools.partial(PortableObjectFile, **kwargs), unique_file_paths))
+
+    po_files = dict(zip(unique_file_paths, po_files))
+    return [po_files[path] for path in file_paths]
 
 
 class PortableObjectFileToXLSX:
@@ -98,10 +196,12 @@ class PortableObjectFileToXLSX:
         lock_sheet: bool = False,
         font_regular_name: str = "Verdana",
         font_regular_size: int = 11,
+        fast_xml: bool = False,
     ):
         """
         message_context = namespace, is optional
         message_id = source string to translate
+        fast_xml = write the rows directly as XML, faster for very large catalogs
         """
         self.po_files = po_files
         self.output_file_path = output_file_path
@@ -123,6 +223,7 @@ class PortableObjectFileToXLSX:
         self.unlock_message_locale = self.lock_sheet
 
         self.always_write_message_context = always_write_message_context
+        self.fast_xml = fast_xml
 
         self.has_message_context = False
         self.has_comment_references = False
@@ -130,13 +231,9 @@ class PortableObjectFileToXLSX:
         self.has_comment_translator = False
 
         # Has message context/namespace/group name
-        if self.always_write_message_context:
-            self.has_message_context = True
-        else:
-            for po_file in self.po_files:
-                if self.has_message_context:
-                    break
-                self.has_message_context = self.has_message_context or po_file.has_any_message_context()
+        self.has_message_context = self.always_write_message_context or any(
+            po_file.has_any_message_context() for po_file in self.po_files
+        )
 
         # Fonts
         self.font_regular_name = font_regular_name
@@ -149,18 +246,30 @@ class PortableObjectFileToXLSX:
         self.alignment_wrap_text = Alignment(wrap_text=True)
         self.alignment_shrink_to_fit = Alignment(shrink_to_fit=True)
 
+        # Protection
+        self.protection_unlocked = Protection(locked=False)
+
         # NOTE: using optimized mode
         self.work_book = openpyxl.Workbook(write_only=True)
         self.work_sheet = self.work_book.create_sheet(title="Translations")
 
         self.column_names = self.get_column_names()
 
+        # Column name => index, same as column_names.index() the first column with that name wins
+        self.column_indices = {}
+        for i, name in enumerate(self.column_names):
+            self.column_indices.setdefault(name, i + 1)
+
         # NOTE: if we are not using optimized mode we should move this
         self.apply_style()
 
         self.write_columns_header()
-        self.write_body()
-        self.save()
+        if self.fast_xml:
+            # Also saves
+            self.write_body_fast()
+        else:
+            self.write_body()
+            self.save()
 
     def get_column_names(self):
         columns = []
@@ -189,21 +298,21 @@ class PortableObjectFileToXLSX:
 
     # NOTE: excel uses 1 base indexing
     def get_column_index_message_context(self) -> int:
-        return self.column_names.index(ColumnHeaders.message_context) + 1
+        return self.column_indices[ColumnHeaders.message_context]
 
     def get_column_index_message_id(self) -> int:
-        return self.column_names.index(ColumnHeaders.message_id) + 1
+        return self.column_indices[ColumnHeaders.message_id]
 
     def get_columns_indices_comments(self) -> List[int]:
         indices = []
 
         # index is 1 based
         if self.has_comment_references:
-            indices.append(self.column_names.index(ColumnHeaders.comment_references) + 1)
+            indices.append(self.column_indices[ColumnHeaders.comment_references])
         if self.has_comment_source:
-            indices.append(self.column_names.index(ColumnHeaders.comment_source) + 1)
+            indices.append(self.column_indices[ColumnHeaders.comment_source])
         if self.has_comment_translator:
-            indices.append(self.column_names.index(ColumnHeaders.comment_translator) + 1)
+            indices.append(self.column_indices[ColumnHeaders.comment_translator])
 
         return indices
 
@@ -212,8 +321,8 @@ class PortableObjectFileToXLSX:
 
         for f in self.po_files:
             try:
-                indices.append(self.column_names.index(f.locale) + 1)
-            except ValueError:
+                indices.append(self.column_indices[f.locale])
+            except KeyError:
                 # Locale does not exist
                 pass
 
@@ -240,6 +349,10 @@ class PortableObjectFileToXLSX:
         if self.lock_sheet:
             self.work_sheet.protection.sheet = True
 
+        # The letters of all the columns we style, index is 1 based
+        letters = [None] + [get_column_letter(i) for i in range(1, len(self.column_names) + 6)]
+        column_dimensions = self.work_sheet.column_dimensions
+
         #
         # Set sizes
         #
@@ -254,38 +367,42 @@ class PortableObjectFileToXLSX:
 
         # Comments
         for i in self.get_columns_indices_comments():
-            self.work_sheet.column_dimensions[get_column_letter(i)].width = self.width_comments
+            column_dimensions[letters[i]].width = self.width_comments
 
         # Translations, set the width the same as the message id, as that is the source string
         for i in self.get_column_indices_locales():
-            self.work_sheet.column_dimensions[get_column_letter(i)].width = self.width_message_translation
-
-        # Freeze the first row
-        self.work_sheet.freeze_panes = "A2"
+            column_dimensions[letters[i]].width = self.width_message_translation
 
-        # Freeze the first 2 columns
-        self.work_sheet.freeze_panes = "C2"
+        # Freeze the first row and the columns up to the message id (the source string)
+        self.work_sheet.freeze_panes = letters[self.get_column_index_message_id() + 1] + "2"
 
         # Set fonts extend to the right + 5
-        for i in range(len(self.column_names) + 5):
-            # index is 1 based
-            self.work_sheet.column_dimensions[get_column_letter(i + 1)].font = self.font_regular
+        for letter in letters[1:]:
+            column_dimensions[letter].font = self.font_regular
 
-    def get_cell(self, value, wrap=False, shrink_to_fit=False, bold=False, unlock=False) -> WriteOnlyCell:
-        cell = WriteOnlyCell(self.work_sheet, value=value)
-
-        if bold:
-            cell.font = self.font_regular_bold
-        else:
-            cell.font = self.font_regular
+    def get_cell_style(self, wrap=False, shrink_to_fit=False, bold=False, unlock=False) -> tuple:
+        """ Returns the (font, alignment, protection) tuple of a cell, None means the default """
+        font = self.font_regular_bold if bold else self.font_regular
 
+        alignment = None
         if wrap:
-            cell.alignment = self.alignment_wrap_text
+            alignment = self.alignment_wrap_text
         elif shrink_to_fit:
-            cell.alignment = self.alignment_shrink_to_fit
+            alignment = self.alignment_shrink_to_fit
+
+        protection = self.protection_unlocked if unlock else None
 
-        if unlock:
-            cell.protection = Protection(locked=False)
+        return font, alignment, protection
+
+    def get_cell(self, value, wrap=False, shrink_to_fit=False, bold=False, unlock=False) -> WriteOnlyCell:
+        font, alignment, protection = self.get_cell_style(wrap, shrink_to_fit, bold, unlock)
+
+        cell = WriteOnlyCell(self.work_sheet, value=value)
+        cell.font = font
+        if alignment:
+            cell.alignment = alignment
+        if protection:
+            cell.protection = protection
 
         return cell
 
@@ -296,85 +413,223 @@ class PortableObjectFileToXLSX:
 
         self.work_sheet.append(row)
 
-    def write_body(self):
-        # Collect the messages
-        messages = []
-        seen = set()
+    def get_messages(self):
+        """
+        Yields ((msgid, msgctxt), entry) for all the unique messages, in the order they are first seen in the files.
+        The entry is used to write the first columns, the first file (the reference) has priority.
+        """
+        # NOTE: dicts keep the insertion order, setdefault keeps the entry of the first file with the message
+        messages = {}
         for f in self.po_files:
-            for msg in f.po_file:
-                # Has message
-                if not msg.msgid or msg.obsolete:
-                    continue
+            for key, msg in f.index.items():
+                messages.setdefault(key, msg)
 
-                if (msg.msgid, msg.msgctxt) not in seen:
-                    messages.append((msg.msgid, msg.msgctxt))
-                    seen.add((msg.msgid, msg.msgctxt))
+        yield from messages.items()
 
-        # used to write the first columns
-        reference_po_file = self.po_files[0].po_file
+    def get_body_rows(self, convert_style=None):
+        """
+        Yields the rows after the header, as (values, styles) lists with one item per column.
+        convert_style is called once per distinct (font, alignment, protection) style, to get what the writer uses.
+        A None style means the cell must not be written.
+        """
+        # The styles are the same for every row, compute them only once per column type
+        style_message_context = self.get_cell_style()
+        style_message_id = self.get_cell_style(wrap=self.wrap_message_id)
+        style_comment = self.get_cell_style(wrap=self.wrap_comments, shrink_to_fit=not self.wrap_comments)
+        style_message_locale = self.get_cell_style(
+            wrap=self.wrap_message_translation, unlock=self.unlock_message_locale
+        )
+        style_message_locale_fuzzy = (self.font_fuzzy,) + style_message_locale[1:]
 
-        # The rest of the rows
-        for msgid, msgctxt in messages:
-            row = []
+        # The styles of each column, only rows with fuzzy translations or skipped cells get their own copy
+        row_styles = []
+        if self.has_message_context:
+            row_styles.append(style_message_context)
+        row_styles.append(style_message_id)
+        row_styles.extend([style_comment] * len(self.get_columns_indices_comments()))
+        row_styles.extend([style_message_locale] * len(self.po_files))
+
+        # Empty cells with only the font of the column (set in apply_style) do not need to be written
+        style_column = self.get_cell_style()
+        skip_empty_columns = [i for i, style in enumerate(row_styles) if style == style_column]
+
+        if convert_style:
+            # NOTE: dict keeps the order, so the styles are always converted (registered) in the same order
+            converted_styles = {style: convert_style(style) for style in dict.fromkeys(row_styles)}
+            row_styles = [converted_styles[style] for style in row_styles]
+            style_message_locale_fuzzy = convert_style(style_message_locale_fuzzy)
+
+        for key, msg in self.get_messages():
+            msgid, msgctxt = key
+            values = []
+            styles = row_styles
 
             # Message context
             if self.has_message_context:
-                row.append(self.get_cell(msgctxt))
+                values.append(msgctxt)
 
             # Message id
-            row.append(self.get_cell(msgid, wrap=self.wrap_message_id))
-
-            msg = reference_po_file.find(msgid, msgctxt=msgctxt)
+            values.append(msgid)
 
             # Metadata comment columns
             if self.has_comment_references:
-                data = []
-                if msg is not None:
-                    for (entry, lineno) in msg.occurrences:
-                        if lineno:
-                            data.append("%s:%s" % (entry, lineno))
-                        else:
-                            data.append(entry)
-
-                if data:
-                    row.append(
-                        self.get_cell(", ".join(data), wrap=self.wrap_comments, shrink_to_fit=not self.wrap_comments)
-                    )
-                else:
-                    row.append(self.get_cell(None, wrap=self.wrap_comments, shrink_to_fit=not self.wrap_comments))
+                # NOTE: a list is faster than a generator here, join() would build a list from it anyway
+                values.append(
+                    ", ".join([f"{entry}:{lineno}" if lineno else entry for entry, lineno in msg.occurrences]) or None
+                )
 
             if self.has_comment_source:
-                data = None
-                if msg is not None:
-                    data = msg.comment
-                row.append(self.get_cell(data, wrap=self.wrap_comments, shrink_to_fit=not self.wrap_comments))
+                values.append(msg.comment)
 
             if self.has_comment_translator:
-                data = None
-                if msg is not None:
-                    data = msg.tcomment
-                row.append(self.get_cell(data, wrap=self.wrap_comments, shrink_to_fit=not self.wrap_comments))
+                values.append(msg.tcomment)
 
             # Write the language rows, aka strings to translate
             for f in self.po_files:
-                po_file = f.po_file
-                msg = po_file.find(msgid, msgctxt=msgctxt)
+                msg = f.index.get(key)
                 if msg is None:
-                    row.append(
-                        self.get_cell(None, wrap=self.wrap_message_translation, unlock=self.unlock_message_locale)
-                    )
+                    values.append(None)
                 elif "fuzzy" in msg.flags:
-                    # Weird case
-                    cell = WriteOnlyCell(self.work_sheet, value=msg.msgstr)
-                    cell.font = self.font_fuzzy
-                    row.append(cell)
+                    # Weird case, same as the normal case but marked with a different font
+                    if styles is row_styles:
+                        styles = row_styles.copy()
+                    styles[len(values)] = style_message_locale_fuzzy
+                    values.append(msg.msgstr)
                 else:
                     # Normal case
-                    row.append(
-                        self.get_cell(msg.msgstr, wrap=self.wrap_message_translation, unlock=self.unlock_message_locale)
-                    )
+                    values.append(msg.msgstr)
+
+            for i in skip_empty_columns:
+                if not values[i]:
+                    if styles is row_styles:
+                        styles = row_styles.copy()
+                    styles[i] = None
+
+            yield values, styles
+
+    def write_body(self):
+        work_sheet = self.work_sheet
+
+        def get_style_array(style):
+            return self.get_style_cell(style)._style
+
+        def make_cell(value, style_array):
+            if style_array is None:
+                return None
+
+            # NOTE: the StyleArray is shared by all the cells with that style, this is fine as they are never modified
+            cell = WriteOnlyCell(work_sheet, value=value)
+            cell._style = style_array
+            return cell
 
-            self.work_sheet.append(row)
+        append = work_sheet.append
+        for values, styles in self.get_body_rows(get_style_array):
+            append([make_cell(value, style_array) for value, style_array in zip(values, styles)])
+
+    def get_style_cell(self, style) -> WriteOnlyCell:
+        """ Returns an empty cell with the (font, alignment, protection) style, registers the style in the workbook """
+        cell = WriteOnlyCell(self.work_sheet)
+        cell.font = style[0]
+        if style[1]:
+            cell.alignment = style[1]
+        if style[2]:
+            cell.protection = style[2]
+
+        return cell
+
+    def get_style_id(self, style) -> int:
+        """ Registers the (font, alignment, protection) style in the workbook and returns its index """
+        return self.get_style_cell(style).style_id
+
+    def write_body_fast(self):
+        """
+        Writes the rows after the header directly as sheet XML, without creating any openpyxl cells.
+        The workbook is saved by openpyxl with just the header and the rows are inserted into the sheet after.
+        NOTE: unlike write_body, values starting with "=" are written as text and not as formulas.
+        """
+        # NOTE: starting the rows generator registers the styles, openpyxl writes them so this is done before saving
+        rows = self.get_body_rows(self.get_style_id)
+        first_row = next(rows, None)
+
+        # Only replace the output file once the whole body was written, the rows might fail to convert
+        output_file_path = str(self.output_file_path)
+        header_file_path = output_file_path + ".header.tmp"
+        temp_file_path = output_file_path + ".tmp"
+        try:
+            self.work_book.save(header_file_path)
+            if first_row is None:
+                os.replace(header_file_path, output_file_path)
+            else:
+                body = self.get_body_rows_xml(itertools.chain([first_row], rows))
+                self.insert_body_xml(header_file_path, temp_file_path, body)
+                os.replace(temp_file_path, output_file_path)
+        finally:
+            for file_path in (header_file_path, temp_file_path):
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+
+    def get_body_rows_xml(self, rows):
+        """ Yields the sheet XML of the (values, style ids) rows, encoded """
+        letters = [get_column_letter(i + 1) for i in range(len(self.column_names))]
+
+        for row_index, (values, styles) in enumerate(rows, 2):
+            xml = ['<row r="%d">' % row_index]
+            for letter, value, style_id in zip(letters, values, styles):
+                if style_id is None:
+                    continue
+
+                if not value:
+                    xml.append('<c r="%s%d" s="%d"/>' % (letter, row_index, style_id))
+                    continue
+
+                # Same check as openpyxl does when setting the value of a cell
+                if ILLEGAL_CHARACTERS_RE.search(value):
+                    raise IllegalCharacterError(f"{value} cannot be used in worksheets.")
+
+                # Same as xml.sax.saxutils.escape, inlined as it is called for every cell
+                value = value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace("\r", "&#13;")
+                xml.append(
+                    '<c r="%s%d" s="%d" t="inlineStr"><is><t xml:space="preserve">%s</t></is></c>'
+                    % (letter, row_index, style_id, value)
+                )
+
+            xml.append("</row>")
+            yield "".join(xml).encode("utf-8")
+
+    def insert_body_xml(self, source_file_path: str, target_file_path: str, body):
+        """
+        Copies the saved source file to the target file, with the rows XML inserted at the end of the sheet data.
+        The body is an iterable of encoded XML, it is compressed as it is generated.
+        """
+        sheet_path = self.work_sheet.path[1:]
+
+        with zipfile.ZipFile(source_file_path) as source, zipfile.ZipFile(
+            target_file_path, "w", zipfile.ZIP_DEFLATED
+        ) as target:
+            for item in source.infolist():
+                data = source.read(item.filename)
+                if item.filename != sheet_path:
+                    target.writestr(item, data)
+                    continue
+
+                head, tail = data.split(b"</sheetData>", 1)
+                with target.open(item.filename, "w") as sheet:
+                    sheet.write(head)
+
+                    # Write in chunks, each write compresses
+                    chunk = []
+                    chunk_size = 0
+                    for xml in body:
+                        chunk.append(xml)
+                        chunk_size += len(xml)
+                        if chunk_size >= 1024 * 1024:
+                            sheet.write(b"".join(chunk))
+                            chunk = []
+                            chunk_size = 0
+                    sheet.write(b"".join(chunk))
+
+                    sheet.write(b"</sheetData>")
+                    sheet.write(tail)
 
     def save(self):
         self.work_book.save(str(self.output_file_path))
@@ -398,7 +653,9 @@ class XLSXToPortableObjectFile:
         self.input_file_path = input_file_path
         self.output_file_path = output_file_path
         self.copy_metadata_from_target = copy_metadata_from_target
-        self.book = openpyxl.load_workbook(input_file_path)
+        # NOTE: using read only mode, we only iterate the rows once
+        # NOTE: not using data_only, messages starting with "=" are written as formulas and we want their text back
+        self.book = openpyxl.load_workbook(input_file_path, read_only=True)
 
         # Already has file?
         existing_po_file = None
@@ -425,17 +682,17 @@ class XLSXToPortableObjectFile:
         self.po_file.metadata["Language"] = locale
         self.po_file.metadata["Generated-By"] = f"xls2po {version}"
 
-        # Make metadata ordered it ordered
-        self.po_file.metadata = OrderedDict(self.po_file.metadata)
-
         # Transfer data
         for sheet in self.book.worksheets:
-            if sheet.max_row < 2:
+            # NOTE: do not use max_row to skip empty sheets, in read only mode the dimensions might be unknown or
+            # wrong and computing them means reading the whole sheet
+            row_iterator = sheet.iter_rows(values_only=True)
+            try:
+                headers = next(row_iterator)
+            except StopIteration:
+                # Empty sheet
                 continue
 
-            print("Processing sheet %s" % sheet.title)
-            row_iterator = sheet.iter_rows()
-            headers = [c.value for c in next(row_iterator)]
             headers = dict((b, a) for (a, b) in enumerate(headers))
 
             message_context_column_index = headers.get(ColumnHeaders.message_context)
@@ -445,62 +702,88 @@ class XLSXToPortableObjectFile:
             comment_column_index = headers.get(ColumnHeaders.comment_source)
             message_locale_column_index = headers.get(locale)
 
+            # Not a translations sheet, notes or anything else the user added
             if message_id_column_index is None:
-                print('Could not find a "%s" column' % ColumnHeaders.message_id, err=True)
                 continue
 
+            print("Processing sheet %s" % sheet.title)
             if message_locale_column_index is None:
-                print('Could not find a "%s" column' % locale, err=True)
+                print('Could not find a "%s" column' % locale, file=sys.stderr)
                 continue
 
+            # Get all the columns we need from a row at once, the missing columns read the None after the last one
+            columns_indices = [
+                message_id_column_index,
+                message_locale_column_index,
+                message_context_column_index,
+                comment_translator_column_index,
+                comment_column_index,
+                comment_references_column_index,
+            ]
+            row_length = max(i for i in columns_indices if i is not None) + 1
+            get_columns = operator.itemgetter(*(row_length if i is None else i for i in columns_indices))
+            row_padding = (None,) * (row_length + 1)
+
+            # Bind these once, they are used for every row
+            POEntry = polib.POEntry
+            append_entry = self.po_file.append
+
             # Process each value
             for row_index, row in enumerate(row_iterator):
-                row = [c.value for c in row]
-                if not row[message_id_column_index]:
-                    continue
+                # NOTE: in read only mode the empty cells at the end of a row might be missing
+                row = row[:row_length] + row_padding[min(len(row), row_length) :]
 
-                try:
-                    msgid = row[message_id_column_index]
+                msgid, msgstr, msgctxt, tcomment, comment, references = get_columns(row)
+                if not msgid:
+                    continue
 
-                    # Special case, sometimes this is identified as empty object?
-                    msgstr = row[message_locale_column_index]
+                # Empty string most likely
+                if msgstr is None:
+                    msgstr = ""
 
-                    # Empty string most likely
-                    if msgstr is None:
-                        msgstr = ""
+                # Type different than default
+                if not isinstance(msgstr, str):
+                    print(f"[WARNING][row={row_index}] key={msgid} got value of type = {type(msgstr)}")
+                    msgstr = str(msgstr)
 
-                    # Type different than default
-                    if not isinstance(msgstr, str):
-                        print(f"[WARNING][row={row_index}] key={msgid} got value of type = {type(msgstr)}")
+                entry = POEntry(msgid=str(msgid), msgstr=msgstr)
 
-                    entry = polib.POEntry(msgid=str(msgid), msgstr=str(msgstr) or "")
+                if msgctxt:
+                    entry.msgctxt = str(msgctxt)
+                if tcomment:
+                    entry.tcomment = str(tcomment)
+                if comment:
+                    entry.comment = str(comment)
+                if references:
+                    entry.occurrences = self.parse_references(str(references))
 
-                    if message_context_column_index is not None and row[message_context_column_index]:
-                        entry.msgctxt = str(row[message_context_column_index])
-                    if comment_translator_column_index:
-                        entry.tcomment = str(row[comment_translator_column_index])
-                    if comment_column_index:
-                        entry.comment = str(row[comment_column_index])
-                    if comment_references_column_index:
-                        entry.occurrences = str(row[comment_references_column_index])
+                append_entry(entry)
 
-                    self.po_file.append(entry)
-                except IndexError:
-                    print("Row %s is too short" % row)
+        # Read only mode keeps the file open until closed
+        self.book.close()
 
         if not self.po_file:
-            sys.exit("No messages found, aborting", 1)
+            sys.exit("No messages found, aborting")
 
         self.save()
 
+    def parse_references(self, value: str) -> list:
+        """
+        Converts the references column back to a list of (file, lineno), the reverse of how they are written.
+        Example: "file.py:10, other.py" => [("file.py", "10"), ("other.py", "")]
+        """
+        occurrences = []
+        for reference in value.split(", "):
+            file_path, _, lineno = reference.rpartition(":")
+            if file_path and lineno.isdigit():
+                occurrences.append((file_path, lineno))
+            else:
+                occurrences.append((reference, ""))
+
+        return occurrences
+
     def po_timestamp(self, filename):
-        local = time.localtime(os.stat(filename).st_mtime)
-        offset = -(time.altzone if local.tm_isdst else time.timezone)
-        return "%s%s%s" % (
-            time.strftime("%Y-%m-%d %H:%M", local),
-            "-" if offset < 0 else "+",
-            time.strftime("%H%M", time.gmtime(abs(offset))),
-        )
+        return format_po_timestamp(os.stat(filename).st_mtime)
 
     def save(self):
         """
@@ -31,7 +31,7 @@ setup(
     py_modules=["po_excel_translate", "po2xls", "xls2po"],
     include_package_data=True,
     zip_safe=True,
-    install_requires=["click", "polib", "openpyxl"],
+    install_requires=["click", "polib", "openpyxl", "lxml"],
     entry_points={"console_scripts": ["po2xls=po2xls:main", "xls2po=xls2po:main"]},
     python_requires=">=3.6",
 )
@@ -1,11 +1,5 @@
-import os
-import sys
-import time
 import click
-import polib
-import openpyxl
 from pathlib import Path
-from po_excel_translate import XLSXToPortableObjectFile
 
 
 @click.command()
@@ -16,6 +10,9 @@ def main(locale, input_file, output_file):
     """
     Convert a XLS(X) file to a .PO file
     """
+    # NOTE: imported here so that --help does not have to import openpyxl
+    from po_excel_translate import XLSXToPortableObjectFile
+
     XLSXToPortableObjectFile(locale=locale, input_file_path=Path(str(input_file)), output_file_path=Path(output_file))
 
 